@@ -246,7 +246,7 @@ def _to_scalar(x, dtype):
 def _update_assign(updating, accum, mask, mask_type, replace, x):
     if mask is not None:
         mask = mask_type(mask.value)
-    updating.value(accum=accum, mask=mask, replace=replace) << x.value
+    updating.value._update(x.value, mask=mask, accum=accum, replace=replace)
     return updating
 
 
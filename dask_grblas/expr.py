@@ -2,7 +2,8 @@ import dask.array as da
 import grblas as gb
 import numpy as np
 from functools import partial
-from .base import BaseType, InnerBaseType
+from operator import attrgetter
+from .base import BaseType, InnerBaseType, _dup
 from .mask import Mask
 from .utils import np_dtype, get_meta, get_return_type, get_grblas_type, wrap_inner
 
@@ -18,11 +19,27 @@ class GbDelayed:
     def _reduce(self, dtype):
         assert not self.kwargs
         op = self.args[0]
+        delayed = self.parent._delayed
+        name = f'reduce-{op.name}'
+        if all(n == 1 for n in delayed.numblocks):
+            # Nothing to combine, so reduce the only chunk in a single task
+            return da.blockwise(
+                partial(_reduce, op, dtype),
+                (),
+                delayed,
+                tuple(range(delayed.ndim)),
+                concatenate=False,
+                token=name,
+                dtype=np_dtype(dtype),
+                meta=np.empty((), dtype=np_dtype(dtype)),
+            )
         delayed = da.reduction(
-            self.parent._delayed,
+            delayed,
             partial(_reduce, op, dtype),
             partial(_reduce_combine, op),
             concatenate=False,
+            split_every=8,
+            name=name,
             dtype=np_dtype(dtype),
         )
         return delayed
@@ -154,35 +171,36 @@ class Updater:
 
 
 def _extractor_new(x, dtype, mask, mask_type):
-    indices = []
-    inner = x
-    while inner.index is not None:
-        indices.append(inner.index)
-        inner = inner.inner
-    inner = inner.inner
     if mask is not None:
         mask = mask_type(mask.value)
-    if len(indices) == 0:
+    if x.index is None:
         # Is there some way we can avoid this dup here?
         # This likely comes from a slice sich as v[:] or v[:10]
         # Ideally, we would use `_optional_dup` in the DAG
-        value = inner.value.dup(dtype=dtype, mask=mask)
-    elif len(indices) == 1:
-        index = indices[0]
+        value = x.inner.value.dup(dtype=dtype, mask=mask)
+    elif x.inner.index is None:
+        index = x.index
         if type(index) is tuple and len(index) == 1:
             index = index[0]
-        value = inner.value[index].new(dtype=dtype, mask=mask)
+        value = x.inner.inner.value[index].new(dtype=dtype, mask=mask)
     else:
+        indices = []
+        inner = x
+        while inner.index is not None:
+            indices.append(inner.index)
+            inner = inner.inner
         raise NotImplementedError(f'indices: {indices}')
     return wrap_inner(value)
 
 
 class Extractor:
+    __slots__ = 'inner', 'index', 'dtype', 'ndim'
+
     def __init__(self, inner, index=None):
         self.inner = inner
         self.index = index
         self.dtype = inner.dtype
-        self.ndim = inner.dtype
+        self.ndim = inner.ndim
 
     def __getitem__(self, index):
         return Extractor(self, index)
@@ -211,6 +229,19 @@ class AmbiguousAssignOrExtract:
             indices = (self.index,)
         else:
             indices = self.index
+        if len(indices) == len(self.parent.shape) and all(
+            type(index) is slice and index == slice(None) for index in indices
+        ):
+            # v[:] or A[:, :] selects everything, so copy each block directly
+            delayed = da.core.elemwise(
+                _dup,
+                self.parent._delayed,
+                delayed_mask,
+                dtype,
+                grblas_mask_type,
+                dtype=np_dtype(meta.dtype),
+            )
+            return get_return_type(meta)(delayed)
         if len(indices) == 1 or len(indices) == 2:
             delayed = self.parent._delayed.map_blocks(
                 Extractor,
@@ -254,21 +285,42 @@ def _expr_new(method_name, dtype, grblas_mask_type, kwargs, x, mask, *args):
     return wrap_inner(expr.new(dtype=dtype, mask=mask))
 
 
+_meta_empties = {}
+
+
+def _meta_empty(dtype):
+    """ Shared empty array returned by task functions when dask is computing meta"""
+    try:
+        return _meta_empties[dtype]
+    except KeyError:
+        rv = _meta_empties[dtype] = np.empty(0, dtype=dtype)
+        return rv
+
+
 def _reduce(op, gb_dtype, x, axis=None, keepdims=None, computing_meta=None, dtype=None):
     """ Call reduce on each chunk"""
     if computing_meta:
-        return np.empty(0, dtype=dtype)
+        return _meta_empty(dtype)
+    while isinstance(x, list):
+        # The single chunk from `da.blockwise(..., concatenate=False)`
+        x, = x
     return wrap_inner(x.value.reduce(op).new(dtype=gb_dtype))
 
 
+_getvalue = attrgetter('value.value')
+
+
 def _reduce_combine(op, x, axis=None, keepdims=None, computing_meta=None, dtype=None):
     """ Combine results from reduce on each chunk"""
     if computing_meta:
-        return np.empty(0, dtype=dtype)
-    if type(x) is list:
+        return _meta_empty(dtype)
+    if isinstance(x, list):
+        if len(x) == 1:
+            # Nothing to combine; avoid building a Vector just to reduce it
+            return x[0]
         # do we need `gb_dtype` instead of `np_dtype` below?
-        vals = [val.value.value for val in x]
-        values = gb.Vector.from_values(list(range(len(x))), vals, size=len(x), dtype=dtype)
+        vals = list(map(_getvalue, x))
+        values = gb.Vector.from_values(np.arange(len(vals), dtype=np.int64), vals, size=len(vals), dtype=dtype)
         return wrap_inner(values.reduce(op).new())
     else:
         return x
@@ -279,13 +331,9 @@ def _reduce_accum(output, reduced, accum):
     # This is pretty ugly.  If only we could call binary operators on scalars...
     dtype = output.value.dtype
     if output.value.is_empty:
-        left = gb.Vector.new(dtype, 1)
-    else:
-        left = gb.Vector.from_values([0], [output.value.value], dtype=dtype)
-    if reduced.value.is_empty:
-        right = gb.Vector.new(reduced.value.dtype, 1)
-    else:
-        right = gb.Vector.from_values([0], [reduced.value.value], dtype=reduced.value.dtype)
+        return wrap_inner(reduced.value.dup(dtype=dtype))
+    left = gb.Vector.from_values([0], [output.value.value], dtype=dtype)
+    right = gb.Vector.from_values([0], [reduced.value.value], dtype=reduced.value.dtype)
     result = left.ewise_add(right, op=accum, require_monoid=False).new(dtype=dtype)
     result = result[0].new()
     return wrap_inner(result)
@@ -296,7 +344,7 @@ def _update_expr(method_name, updating, x, kwargs, *args):
     # v << left.ewise_mult(right)
     args = [x.value if isinstance(x, InnerBaseType) else x for x in args]
     expr = getattr(x.value, method_name)(*args, **kwargs)
-    updating.value << expr
+    updating.value._update(expr)
     return updating
 
 
@@ -307,5 +355,5 @@ def _update_expr_full(method_name, updating, accum, mask, mask_type, replace, x,
     expr = getattr(x.value, method_name)(*args, **kwargs)
     if mask is not None:
         mask = mask_type(mask.value)
-    updating.value(accum=accum, mask=mask, replace=replace) << expr
+    updating.value._update(expr, mask=mask, accum=accum, replace=replace)
     return updating
@@ -2,7 +2,11 @@ import numpy as np
 
 
 def np_dtype(dtype):
-    return np.dtype(dtype.numba_type.name)
+    try:
+        return _np_dtypes[dtype.name]
+    except KeyError:
+        rv = _np_dtypes[dtype.name] = np.dtype(dtype.numba_type.name)
+        return rv
 
 
 def get_meta(val):
@@ -25,6 +29,8 @@ def wrap_inner(val):
     return _inner_types[type(val)](val)
 
 
+_np_dtypes = {}
+
 # These will be finished constructed in __init__
 _grblas_types = {}
 _inner_types = {}
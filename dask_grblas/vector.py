@@ -35,12 +35,14 @@ class InnerVector(InnerBaseType):
                 elif type(index) is slice and index == slice(None):
                     # [None, :]
                     matrix_value = gb.Matrix.new(self.value.dtype, 1, self.value.size)
-                    matrix_value[0, :] = self.value
+                    if self.value.nvals > 0:
+                        matrix_value[0, :] = self.value
                 else:
                     # [None, :5], [None, [1, 2]], etc
                     value = self.value[index].new()
                     matrix_value = gb.Matrix.new(self.value.dtype, 1, value.size)
-                    matrix_value[0, :] = value
+                    if value.nvals > 0:
+                        matrix_value[0, :] = value
                 return InnerMatrix(matrix_value)
             elif index[1] is None:
                 index = index[0]
@@ -51,12 +53,14 @@ class InnerVector(InnerBaseType):
                 elif type(index) is slice and index == slice(None):
                     # [:, None]
                     matrix_value = gb.Matrix.new(self.value.dtype, self.value.size, 1)
-                    matrix_value[:, 0] = self.value
+                    if self.value.nvals > 0:
+                        matrix_value[:, 0] = self.value
                 else:
                     # [:5, None], [[1, 2], None], etc
                     value = self.value[index].new()
                     matrix_value = gb.Matrix.new(self.value.dtype, value.size, 1)
-                    matrix_value[:, 0] = value
+                    if value.nvals > 0:
+                        matrix_value[:, 0] = value
                 return InnerMatrix(matrix_value)
         raise IndexError(f'Too many indices for vector: {index}')
 
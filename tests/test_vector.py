@@ -169,6 +169,23 @@ def test_reduce(vs):
                 compare(f, (s, v), (ds, dv))
 
 
+def test_reduce_many_chunks():
+    # 17 chunks with split_every=8 combines partial combines and a one-chunk group
+    values = [None if i % 5 == 3 else i - 8 for i in range(17)]
+    v = gb.Vector.from_values(
+        [i for i, val in enumerate(values) if val is not None],
+        [val for val in values if val is not None],
+        size=17,
+    )
+    dv = dgb.concat_vectors([
+        dgb.Vector.new(int, 1) if val is None else dgb.Vector.from_vector(gb.Vector.from_values([0], [val]))
+        for val in values
+    ])
+    compare(lambda x: x.reduce().new(), v, dv)
+    compare(lambda x: x.reduce(gb.monoid.max).new(), v, dv)
+    compare(lambda x: x.reduce().new(dtype=dtypes.FP64), v, dv)
+
+
 def test_apply(vs):
     v, dvs = vs
 
@@ -242,6 +259,21 @@ def test_extract(vs, ws):
                 compare(f, (v.dup(dtype=float), w), (dv.dup(dtype=float), dw))
 
 
+def test_stack_with_empty_block():
+    # The first block has values and the second is empty; the sliced cases cut into both
+    dv = dgb.concat_vectors([
+        dgb.Vector.from_vector(gb.Vector.from_values([0, 1], [1, 2])),
+        dgb.Vector.new(int, 2),
+    ])
+    for result, expected in [
+        (dgb.column_stack([dv]), gb.Matrix.from_values([0, 1], [0, 0], [1, 2], nrows=4, ncols=1)),
+        (dgb.row_stack([dv]), gb.Matrix.from_values([0, 0], [0, 1], [1, 2], nrows=1, ncols=4)),
+        (dgb.Matrix(dv._delayed[1:3, None]), gb.Matrix.from_values([0], [0], [2], nrows=2, ncols=1)),
+        (dgb.Matrix(dv._delayed[None, 1:3]), gb.Matrix.from_values([0], [0], [2], nrows=1, ncols=2)),
+    ]:
+        assert result.compute().isequal(expected, check_dtype=True)
+
+
 def test_attrs(vs):
     v, dvs = vs
     dv = dvs[0]